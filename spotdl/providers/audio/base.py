@@ -2,9 +2,13 @@
 Base audio provider module.
 """
 
+import concurrent.futures
 import logging
+import queue
 import re
 import shlex
+import threading
+from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from yt_dlp import YoutubeDL
@@ -16,6 +20,7 @@ from spotdl.utils.formatter import (
     args_to_ytdlp_options,
     create_search_query,
     create_song_title,
+    slugify,
 )
 from spotdl.utils.matching import get_best_matches, order_results
 
@@ -115,7 +120,41 @@ class AudioProvider:
             user_options = args_to_ytdlp_options(shlex.split(yt_dlp_args))
             yt_dlp_options.update(user_options)
 
-        self.audio_handler = YoutubeDL(yt_dlp_options)
+        self.yt_dlp_options = yt_dlp_options
+        self._audio_handler: Optional[YoutubeDL] = None
+        self._audio_handler_lock = threading.Lock()
+        self._worker_audio_handlers: "queue.Queue[YoutubeDL]" = queue.Queue()
+
+    @property
+    def audio_handler(self) -> YoutubeDL:
+        """
+        Get the yt-dlp audio handler.
+        It's created on first use, since setting up yt-dlp is slow
+        and most providers only need it to download songs.
+
+        ### Returns
+        - The yt-dlp audio handler.
+        """
+
+        if self._audio_handler is None:
+            # Lock so that threads accessing the handler
+            # at the same time don't create one each
+            with self._audio_handler_lock:
+                if self._audio_handler is None:
+                    self._audio_handler = YoutubeDL(self.yt_dlp_options)
+
+        return self._audio_handler
+
+    @audio_handler.setter
+    def audio_handler(self, audio_handler: YoutubeDL) -> None:
+        """
+        Set the yt-dlp audio handler.
+
+        ### Arguments
+        - audio_handler: The yt-dlp audio handler.
+        """
+
+        self._audio_handler = audio_handler
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
         """
@@ -131,18 +170,19 @@ class AudioProvider:
 
         raise NotImplementedError
 
-    def get_views(self, url: str) -> int:
+    def get_views(self, url: str, audio_handler: Optional[YoutubeDL] = None) -> int:
         """
         Get the number of views for a video.
 
         ### Arguments
         - url: The url of the video.
+        - audio_handler: The yt-dlp audio handler to use instead of the provider's one.
 
         ### Returns
         - The number of views.
         """
 
-        data = self.get_download_metadata(url)
+        data = self.get_download_metadata(url, audio_handler=audio_handler)
 
         return data["view_count"]
 
@@ -164,48 +204,61 @@ class AudioProvider:
                 song, self.search_query, False, None, True
             )
 
+        # Slugified search query is used to match results
+        # of all of the searches below
+        slug_song_title = slugify(search_query)
+
         logger.debug("[%s] Searching for %s", song.song_id, search_query)
 
         isrc_urls: List[str] = []
 
-        # search for song using isrc if it's available
-        if song.isrc and self.SUPPORTS_ISRC and not self.search_query:
-            isrc_results = self.get_results(song.isrc, **self.GET_RESULTS_OPTS[0])
+        # Normalize the isrc, so that providers recognize it as one
+        isrc = song.isrc.strip().upper() if song.isrc else None
+
+        # search for song using isrc if it's available,
+        # skip the request if the isrc is malformed
+        if (
+            isrc
+            and self.SUPPORTS_ISRC
+            and not self.search_query
+            and ISRC_REGEX.match(isrc)
+        ):
+            isrc_results = self.get_results(isrc, **self.GET_RESULTS_OPTS[0])
 
             if only_verified:
                 isrc_results = [result for result in isrc_results if result.verified]
 
             isrc_urls = [result.url for result in isrc_results]
-            sorted_isrc_results = order_results(isrc_results, song, self.search_query)
+            sorted_isrc_results = order_results(
+                isrc_results, song, self.search_query, slug_song_title
+            )
             logger.debug(
                 "[%s] Found %s results for ISRC %s",
                 song.song_id,
                 len(isrc_results),
-                song.isrc,
+                isrc,
             )
 
-            if len(isrc_results) > 0:
-                # get the best result, if the score is above 80 return it
-                best_isrc_results = sorted(
-                    sorted_isrc_results.items(), key=lambda x: x[1], reverse=True
-                )
+            logger.debug(
+                "[%s] Filtered to %s ISRC results",
+                song.song_id,
+                len(sorted_isrc_results),
+            )
+
+            # get the best result, if the score is above 80 return it
+            best_isrc = max(
+                sorted_isrc_results.items(), key=itemgetter(1), default=None
+            )
+
+            if best_isrc is not None and best_isrc[1] > 80.0:
                 logger.debug(
-                    "[%s] Filtered to %s ISRC results",
+                    "[%s] Best ISRC result is %s with score %s",
                     song.song_id,
-                    len(best_isrc_results),
+                    best_isrc[0].url,
+                    best_isrc[1],
                 )
 
-                if len(best_isrc_results) > 0:
-                    best_isrc = best_isrc_results[0]
-                    if best_isrc[1] > 80.0:
-                        logger.debug(
-                            "[%s] Best ISRC result is %s with score %s",
-                            song.song_id,
-                            best_isrc[0].url,
-                            best_isrc[1],
-                        )
-
-                        return best_isrc[0].url
+                return best_isrc[0].url
 
         results: Dict[Result, float] = {}
         for options in self.GET_RESULTS_OPTS:
@@ -245,13 +298,24 @@ class AudioProvider:
                 "[%s] Have to filter results: %s", song.song_id, self.filter_results
             )
 
-            if self.filter_results:
-                # Order results
-                new_results = order_results(search_results, song, self.search_query)
-            else:
-                new_results = {}
+            if not self.filter_results:
+                # Use the top result as is, there is no point
+                # in searching again or comparing views of unfiltered results
                 if len(search_results) > 0:
-                    new_results = {search_results[0]: 100.0}
+                    logger.debug(
+                        "[%s] Returning unfiltered top result %s",
+                        song.song_id,
+                        search_results[0].url,
+                    )
+
+                    return search_results[0].url
+
+                continue
+
+            # Order results
+            new_results = order_results(
+                search_results, song, self.search_query, slug_song_title
+            )
 
             logger.debug("[%s] Filtered to %s results", song.song_id, len(new_results))
 
@@ -327,12 +391,34 @@ class AudioProvider:
         # return the one with the highest score
         # and most views
         if len(best_results) > 1:
-            views: List[int] = []
-            for best_result in best_results:
-                if best_result[0].views:
-                    views.append(best_result[0].views)
-                else:
-                    views.append(self.get_views(best_result[0].url))
+            # Fetch missing views in parallel,
+            # since every lookup is a separate request
+            missing_views = list(
+                {
+                    best_result[0].url: None
+                    for best_result in best_results
+                    if not best_result[0].views
+                }
+            )
+
+            fetched_views: Dict[str, int] = {}
+            if len(missing_views) == 1:
+                fetched_views[missing_views[0]] = self.get_views(missing_views[0])
+            elif missing_views:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(missing_views), 8)
+                ) as executor:
+                    fetched_views = dict(
+                        zip(
+                            missing_views,
+                            executor.map(self._get_views_in_worker, missing_views),
+                        )
+                    )
+
+            views: List[int] = [
+                best_result[0].views or fetched_views[best_result[0].url]
+                for best_result in best_results
+            ]
 
             highest_views = max(views)
             lowest_views = min(views)
@@ -350,23 +436,56 @@ class AudioProvider:
                 weighted_results.append((best_result[0], score))
 
             # Now we return the result with the highest score
-            return max(weighted_results, key=lambda x: x[1])
+            return max(weighted_results, key=itemgetter(1))
 
         return best_result[0], best_result[1]
 
-    def get_download_metadata(self, url: str, download: bool = False) -> Dict:
+    def _get_views_in_worker(self, url: str) -> int:
+        """
+        Get the number of views for a video from a worker thread.
+        yt-dlp handlers are not thread-safe, so every worker checks out
+        a handler from a pool that is reused by later calls.
+
+        ### Arguments
+        - url: The url of the video.
+
+        ### Returns
+        - The number of views.
+        """
+
+        try:
+            audio_handler = self._worker_audio_handlers.get_nowait()
+        except queue.Empty:
+            audio_handler = YoutubeDL(self.yt_dlp_options)
+
+        try:
+            return self.get_views(url, audio_handler)
+        finally:
+            self._worker_audio_handlers.put(audio_handler)
+
+    def get_download_metadata(
+        self,
+        url: str,
+        download: bool = False,
+        audio_handler: Optional[YoutubeDL] = None,
+    ) -> Dict:
         """
         Get metadata for a download using yt-dlp.
 
         ### Arguments
         - url: The url to get metadata for.
+        - download: Whether to download the song.
+        - audio_handler: The yt-dlp audio handler to use instead of the provider's one.
 
         ### Returns
         - A dictionary containing the metadata.
         """
 
+        if audio_handler is None:
+            audio_handler = self.audio_handler
+
         try:
-            data = self.audio_handler.extract_info(url, download=download)
+            data = audio_handler.extract_info(url, download=download)
 
             if data:
                 return data
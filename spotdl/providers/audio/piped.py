@@ -3,7 +3,9 @@ Piped module for downloading and searching songs.
 """
 
 import logging
+import queue
 import shlex
+import threading
 from typing import Any, Dict, List, Optional
 
 import requests
@@ -79,7 +81,10 @@ class Piped(AudioProvider):
             user_options = args_to_ytdlp_options(shlex.split(yt_dlp_args))
             yt_dlp_options.update(user_options)
 
-        self.audio_handler = YoutubeDL(yt_dlp_options)
+        self.yt_dlp_options = yt_dlp_options
+        self._audio_handler: Optional[YoutubeDL] = None
+        self._audio_handler_lock = threading.Lock()
+        self._worker_audio_handlers: "queue.Queue[YoutubeDL]" = queue.Queue()
         self.session = requests.Session()
 
     def get_results(self, search_term: str, **kwargs) -> List[Result]:
@@ -108,11 +113,12 @@ class Piped(AudioProvider):
 
         search_results = response.json()
 
+        # Check if we are searching by isrc once for all results
+        isrc_search = ISRC_REGEX.search(search_term) is not None
+
         # Simplify results
         results = []
         for result in search_results["items"]:
-            isrc_result = ISRC_REGEX.search(search_term)
-
             results.append(
                 Result(
                     source="piped",
@@ -127,19 +133,26 @@ class Piped(AudioProvider):
                         if kwargs.get("filter") == "music_songs"
                         else None
                     ),
-                    isrc_search=isrc_result is not None,
+                    isrc_search=isrc_search,
                     search_query=search_term,
                 )
             )
 
         return results
 
-    def get_download_metadata(self, url: str, download: bool = False) -> Dict:
+    def get_download_metadata(
+        self,
+        url: str,
+        download: bool = False,
+        audio_handler: Optional[YoutubeDL] = None,
+    ) -> Dict:
         """
         Get metadata for a download using yt-dlp.
 
         ### Arguments
         - url: The url to get metadata for.
+        - download: Whether to download the song.
+        - audio_handler: The yt-dlp audio handler to use instead of the provider's one.
 
         ### Returns
         - A dictionary containing the metadata.
@@ -170,4 +183,7 @@ class Piped(AudioProvider):
                 }
             )
 
-        return self.audio_handler.process_video_result(yt_dlp_json, download=download)
+        if audio_handler is None:
+            audio_handler = self.audio_handler
+
+        return audio_handler.process_video_result(yt_dlp_json, download=download)
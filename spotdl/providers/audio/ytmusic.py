@@ -51,6 +51,9 @@ class YouTubeMusic(AudioProvider):
 
         search_results = self.client.search(search_term, **kwargs)
 
+        # Check if we are searching by isrc once for all results
+        isrc_search = ISRC_REGEX.search(search_term) is not None
+
         # Simplify results
         results = []
         for result in search_results:
@@ -61,8 +64,6 @@ class YouTubeMusic(AudioProvider):
             ):
                 continue
 
-            isrc_result = ISRC_REGEX.search(search_term)
-
             results.append(
                 Result(
                     source=self.name,
@@ -76,7 +77,7 @@ class YouTubeMusic(AudioProvider):
                     author=result["artists"][0]["name"],
                     artists=tuple(map(lambda a: a["name"], result["artists"])),
                     duration=parse_duration(result.get("duration")),
-                    isrc_search=isrc_result is not None,
+                    isrc_search=isrc_search,
                     search_query=search_term,
                     explicit=result.get("isExplicit"),
                     album=(
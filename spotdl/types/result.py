@@ -4,13 +4,21 @@ performed by audio provider.
 """
 
 import json
+import sys
 from dataclasses import asdict, dataclass
 from typing import Any, Dict, Optional, Tuple
 
 __all__ = ["Result"]
 
+# Lots of results are created and matched for every song,
+# so use slots for smaller objects and faster attribute access
+# (dataclasses support slots since Python 3.10)
+DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
 
-@dataclass(frozen=True, eq=True)
+
+@dataclass(frozen=True, eq=True, **DATACLASS_OPTIONS)
 class Result:
     """
     Result is a class that contains all the information about a result from search
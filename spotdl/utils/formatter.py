@@ -13,7 +13,7 @@ from typing import Any, Dict, List, Optional
 from unicodedata import normalize
 
 import pykakasi
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from slugify import slugify as py_slugify
 from yt_dlp.options import create_parser
 from yt_dlp.utils import sanitize_filename
@@ -34,6 +34,7 @@ __all__ = [
     "to_ms",
     "restrict_filename",
     "ratio",
+    "batch_ratio",
     "smart_split",
     "create_path_object",
     "args_to_ytdlp_options",
@@ -120,7 +121,7 @@ def sanitize_string(string: str) -> str:
     return output
 
 
-@lru_cache()
+@lru_cache(maxsize=4096)
 def slugify(string: str) -> str:
     """
     Slugify the string.
@@ -524,7 +525,7 @@ def restrict_filename(pathobj: Path, strict: bool = True) -> Path:
 
 
 @lru_cache()
-def ratio(string1: str, string2: str) -> float:
+def ratio(string1: str, string2: str, score_cutoff: Optional[float] = None) -> float:
     """
     Wrapper for fuzz.ratio
     with lru_cache
@@ -532,12 +533,40 @@ def ratio(string1: str, string2: str) -> float:
     ### Arguments
     - string1: the first string
     - string2: the second string
+    - score_cutoff: ratios lower than this are returned as 0
 
     ### Returns
     - the ratio
     """
 
-    return fuzz.ratio(string1, string2)
+    # Identical strings are always a full match,
+    # no need to calculate the edit distance
+    if string1 and string1 == string2:
+        return 100.0
+
+    return fuzz.ratio(string1, string2, score_cutoff=score_cutoff)
+
+
+def batch_ratio(string: str, strings: List[str]) -> List[float]:
+    """
+    Calculate fuzz.ratio between a string and every string
+    from the list in a single rapidfuzz call
+
+    ### Arguments
+    - string: the string to compare
+    - strings: the strings to compare against
+
+    ### Returns
+    - list of ratios in the same order as `strings`
+    """
+
+    ratios = [0.0] * len(strings)
+    for _, score, index in process.extract(
+        string, strings, scorer=fuzz.ratio, limit=None
+    ):
+        ratios[index] = score
+
+    return ratios
 
 
 def smart_split(
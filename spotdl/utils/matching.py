@@ -2,14 +2,19 @@
 Module for all things matching related
 """
 
+# pylint: disable=too-many-lines
+
 import logging
+from functools import lru_cache
 from itertools import product, zip_longest
 from math import exp
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 
 from spotdl.types.result import Result
 from spotdl.types.song import Song
 from spotdl.utils.formatter import (
+    batch_ratio,
     create_search_query,
     create_song_title,
     ratio,
@@ -19,12 +24,14 @@ from spotdl.utils.logging import MATCH
 
 __all__ = [
     "FORBIDDEN_WORDS",
-    "fill_string",
+    "create_simple_slug",
+    "fill_strings",
     "create_clean_string",
     "sort_string",
     "based_sort",
     "check_common_word",
     "check_forbidden_words",
+    "create_slug_song_title",
     "create_match_strings",
     "get_best_matches",
     "calc_main_artist_match",
@@ -32,9 +39,12 @@ __all__ = [
     "artists_match_fixup1",
     "artists_match_fixup2",
     "artists_match_fixup3",
+    "create_name_strings",
     "calc_name_match",
+    "calc_name_matches",
     "calc_time_match",
     "calc_album_match",
+    "calc_album_matches",
 ]
 
 logger = logging.getLogger(__name__)
@@ -71,32 +81,54 @@ def debug(song_id: str, result_id: str, message: str) -> None:
     logger.log(MATCH, "[%s|%s] %s", song_id, result_id, message)
 
 
-def fill_string(strings: List[str], main_string: str, string_to_check: str) -> str:
+@lru_cache(maxsize=4096)
+def create_simple_slug(string: str) -> str:
+    """
+    Slugify the string and remove dashes from it,
+    the same string is usually checked many times per search
+
+    ### Arguments
+    - string: string to slugify
+
+    ### Returns
+    - slugified string without dashes
+    """
+
+    return slugify(string).replace("-", "")
+
+
+def fill_strings(strings: List[str], string1: str, string2: str) -> Tuple[str, str]:
     """
-    Create a string with strings from `strings` list
-    if they are not yet present in main_string
-    but are present in string_to_check
+    Fill both strings with strings from `strings` list
+    if they are not yet present in the string
+    but are present in the other string
 
     ### Arguments
     - strings: strings to check
-    - main_string: string to add strings to
-    - string_to_check: string to check if strings are present in
+    - string1: first string to fill
+    - string2: second string to fill
 
     ### Returns
-    - string with strings from `strings` list
+    - tuple of filled strings
     """
 
-    final_str = main_string
-    test_str = final_str.replace("-", "")
-    simple_test_str = string_to_check.replace("-", "")
-    for string in strings:
-        slug_str = slugify(string).replace("-", "")
+    slug_strs = [create_simple_slug(string) for string in strings]
+
+    test_str1 = string1.replace("-", "")
+    test_str2 = string2.replace("-", "")
+    for slug_str in slug_strs:
+        if slug_str in test_str2 and slug_str not in test_str1:
+            string1 += f"-{slug_str}"
+            test_str1 += slug_str
 
-        if slug_str in simple_test_str and slug_str not in test_str:
-            final_str += f"-{slug_str}"
-            test_str += slug_str
+    # Second string is filled only after the first one is complete,
+    # since strings added to the first one can create new matches
+    for slug_str in slug_strs:
+        if slug_str in test_str1 and slug_str not in test_str2:
+            string2 += f"-{slug_str}"
+            test_str2 += slug_str
 
-    return final_str
+    return string1, string2
 
 
 def create_clean_string(
@@ -116,11 +148,11 @@ def create_clean_string(
     - string with strings from `words` list
     """
 
-    string = slugify(string).replace("-", "")
+    string = create_simple_slug(string)
 
     final = []
     for word in words:
-        word = slugify(word).replace("-", "")
+        word = create_simple_slug(word)
 
         if word in string:
             continue
@@ -213,8 +245,8 @@ def check_forbidden_words(song: Song, result: Result) -> Tuple[bool, List[str]]:
     - True if forbidden word is present in result name, False otherwise
     """
 
-    song_name = slugify(song.name).replace("-", "")
-    to_check = slugify(result.name).replace("-", "")
+    song_name = create_simple_slug(song.name)
+    to_check = create_simple_slug(result.name)
 
     words = []
     for word in FORBIDDEN_WORDS:
@@ -224,8 +256,30 @@ def check_forbidden_words(song: Song, result: Result) -> Tuple[bool, List[str]]:
     return len(words) > 0, words
 
 
+def create_slug_song_title(song: Song, search_query: Optional[str] = None) -> str:
+    """
+    Create slugified song title used to match results
+
+    ### Arguments
+    - song: song to create title for
+    - search_query: search query used to find the results
+
+    ### Returns
+    - slugified song title
+    """
+
+    return slugify(
+        create_song_title(song.name, song.artists)
+        if not search_query
+        else create_search_query(song, search_query, False, None, True)
+    )
+
+
 def create_match_strings(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    slug_song_title: Optional[str] = None,
 ) -> Tuple[str, str]:
     """
     Create strings based on song and result to match
@@ -234,24 +288,22 @@ def create_match_strings(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used to find the result
+    - slug_song_title: precreated `create_slug_song_title` value
 
     ### Returns
     - tuple of strings to match
     """
 
     slug_song_name = slugify(song.name)
-    slug_song_title = slugify(
-        create_song_title(song.name, song.artists)
-        if not search_query
-        else create_search_query(song, search_query, False, None, True)
-    )
+    if slug_song_title is None:
+        slug_song_title = create_slug_song_title(song, search_query)
 
     test_str1 = slugify(result.name)
     test_str2 = slug_song_name if result.verified else slug_song_title
 
     # Fill strings with missing artists
-    test_str1 = fill_string(song.artists, test_str1, test_str2)
-    test_str2 = fill_string(song.artists, test_str2, test_str1)
+    test_str1, test_str2 = fill_strings(song.artists, test_str1, test_str2)
 
     # Sort both strings and then join them
     test_list1, test_list2 = based_sort(test_str1.split("-"), test_str2.split("-"))
@@ -274,19 +326,23 @@ def get_best_matches(
     - list of best matches
     """
 
-    result_items = list(results.items())
+    # Nothing to pick from
+    if len(results) == 1:
+        return list(results.items())
 
-    # Sort results by highest score
-    sorted_results = sorted(result_items, key=lambda x: x[1], reverse=True)
+    # Only results within the threshold of the best score are returned,
+    # so there is no need to sort all of them
+    best_score = max(results.values())
 
-    best_score = sorted_results[0][1]
-
-    return [
+    best_results = [
         result
-        for result in sorted_results
+        for result in results.items()
         if (best_score - result[1]) <= score_threshold
     ]
 
+    # Sort results by highest score
+    return sorted(best_results, key=itemgetter(1), reverse=True)
+
 
 def calc_main_artist_match(song: Song, result: Result) -> float:
     """
@@ -345,7 +401,11 @@ def calc_main_artist_match(song: Song, result: Result) -> float:
         for song_artist, result_artist in product(
             song_artists[:2], sorted_result_artists[:2]
         ):
-            new_artist_match = ratio(song_artist, result_artist)
+            # Lower matches are discarded below,
+            # so rapidfuzz can stop early for them
+            new_artist_match = ratio(
+                song_artist, result_artist, score_cutoff=main_artist_match
+            )
             debug(
                 song.song_id,
                 result.result_id,
@@ -375,9 +435,15 @@ def calc_artists_match(song: Song, result: Result) -> float:
     if len(song.artists) == 1 or not result.artists:
         return artist_match_number
 
-    artist1_list, artist2_list = based_sort(
-        list(map(slugify, song.artists)), list(map(slugify, result.artists))
-    )
+    slug_song_artists = sorted(map(slugify, song.artists))
+    slug_result_artists = sorted(map(slugify, result.artists))
+
+    # Same artists in a different order, every pair
+    # below would be an exact match
+    if slug_song_artists == slug_result_artists:
+        return 100.0
+
+    artist1_list, artist2_list = based_sort(slug_song_artists, slug_result_artists)
 
     # Remove main artist from the lists
     artist1_list, artist2_list = artist1_list[1:], artist2_list[1:]
@@ -415,6 +481,7 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     channel_name_match = ratio(
         slugify(song.artist),
         slugify(", ".join(result.artists)) if result.artists else "",
+        score_cutoff=score,
     )
 
     score = max(score, channel_name_match)
@@ -424,9 +491,9 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
     # with the result's title
     if score <= 70:
         artist_title_match = 0.0
-        result_name = slugify(result.name).replace("-", "")
+        result_name = create_simple_slug(result.name)
         for artist in song.artists:
-            slug_artist = slugify(artist).replace("-", "")
+            slug_artist = create_simple_slug(artist)
 
             if slug_artist in result_name:
                 artist_title_match += 1.0
@@ -439,7 +506,11 @@ def artists_match_fixup1(song: Song, result: Result, score: float) -> float:
 
 
 def artists_match_fixup2(
-    song: Song, result: Result, score: float, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    score: float,
+    search_query: Optional[str] = None,
+    match_strings: Optional[Tuple[str, str]] = None,
 ) -> float:
     """
     Multiple fixes to the artists score for
@@ -449,6 +520,8 @@ def artists_match_fixup2(
     - song: song to match
     - result: result to match
     - score: current score
+    - search_query: search query used to find the result
+    - match_strings: precreated `create_match_strings` value
 
     ### Returns
     - new score
@@ -467,15 +540,18 @@ def artists_match_fixup2(
     # # Check if the main artist is simlar
     has_main_artist = (score / (2 if len(song.artists) > 1 else 1)) > 50
 
-    _, match_str2 = create_match_strings(song, result, search_query)
+    if match_strings is None:
+        match_strings = create_match_strings(song, result, search_query)
+
+    _, match_str2 = match_strings
 
     # Check if other song artists are in the result name
     # if they are, we increase the artist match
     # (main artist is already checked, so we skip it)
+    simple_match_str2 = match_str2.replace("-", "")
     artists_to_check = song.artists[int(has_main_artist) :]
     for artist in artists_to_check:
-        artist = slugify(artist).replace("-", "")
-        if artist in match_str2.replace("-", ""):
+        if create_simple_slug(artist) in simple_match_str2:
             score += 5
 
     # if the artist match is still too low,
@@ -490,7 +566,7 @@ def artists_match_fixup2(
             True,
         )
 
-        artist_title_match = ratio(artist_list1, artist_list2)
+        artist_title_match = ratio(artist_list1, artist_list2, score_cutoff=score)
 
         score = max(score, artist_title_match)
 
@@ -527,6 +603,7 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
     artists_score_fixup = ratio(
         slugify(result.name),
         slugify(create_song_title(song.name, [song.artist])),
+        score_cutoff=80,
     )
 
     if artists_score_fixup >= 80:
@@ -538,8 +615,52 @@ def artists_match_fixup3(song: Song, result: Result, score: float) -> float:
     return score
 
 
+def create_name_strings(song: Song, result: Result) -> Tuple[str, str]:
+    """
+    Create sorted slugs of the result name and song name to match
+
+    ### Arguments
+    - song: song to match
+    - result: result to match
+
+    ### Returns
+    - tuple of result name and song name
+    """
+
+    result_name, song_name = slugify(result.name), slugify(song.name)
+
+    res_list, song_list = based_sort(result_name.split("-"), song_name.split("-"))
+
+    return "-".join(res_list), "-".join(song_list)
+
+
+def calc_name_matches(name_strings: List[Tuple[str, str]]) -> List[float]:
+    """
+    Calculate initial name match percentage for multiple results at once
+
+    ### Arguments
+    - name_strings: `create_name_strings` values of the results
+
+    ### Returns
+    - list of name match percentages in the same order as `name_strings`
+    """
+
+    if not name_strings:
+        return []
+
+    # Song name is sorted the same way for every result
+    # so we can match all result names against it in one go
+    song_name = name_strings[0][1]
+
+    return batch_ratio(song_name, [result_name for result_name, _ in name_strings])
+
+
 def calc_name_match(
-    song: Song, result: Result, search_query: Optional[str] = None
+    song: Song,
+    result: Result,
+    search_query: Optional[str] = None,
+    name_match: Optional[float] = None,
+    match_strings: Optional[Tuple[str, str]] = None,
 ) -> float:
     """
     Calculate name match percentage
@@ -547,6 +668,9 @@ def calc_name_match(
     ### Arguments
     - song: song to match
     - result: result to match
+    - search_query: search query used to find the result
+    - name_match: initial name match calculated with `calc_name_matches`
+    - match_strings: precreated `create_match_strings` value
 
     ### Returns
     - name match percentage
@@ -554,21 +678,23 @@ def calc_name_match(
 
     # Create match strings that will be used
     # to calculate name match value
-    match_str1, match_str2 = create_match_strings(song, result, search_query)
-    result_name, song_name = slugify(result.name), slugify(song.name)
+    if match_strings is None:
+        match_strings = create_match_strings(song, result, search_query)
 
-    res_list, song_list = based_sort(result_name.split("-"), song_name.split("-"))
-    result_name, song_name = "-".join(res_list), "-".join(song_list)
+    match_str1, match_str2 = match_strings
 
     # Calculate initial name match
-    name_match = ratio(result_name, song_name)
+    if name_match is None:
+        result_name, song_name = create_name_strings(song, result)
+        name_match = ratio(result_name, song_name)
+
+        debug(
+            song.song_id,
+            result.result_id,
+            f"SLUG MATCH STRINGS: {song_name} - {result_name}",
+        )
 
     debug(song.song_id, result.result_id, f"MATCH STRINGS: {match_str1} - {match_str2}")
-    debug(
-        song.song_id,
-        result.result_id,
-        f"SLUG MATCH STRINGS: {song_name} - {result_name}",
-    )
     debug(song.song_id, result.result_id, f"First name match: {name_match}")
 
     # If name match is lower than 60%,
@@ -577,6 +703,7 @@ def calc_name_match(
         second_name_match = ratio(
             match_str1,
             match_str2,
+            score_cutoff=name_match,
         )
 
         debug(
@@ -625,10 +752,35 @@ def calc_album_match(song: Song, result: Result) -> float:
     return ratio(slugify(song.album_name), slugify(result.album))
 
 
+def calc_album_matches(song: Song, results: List[Result]) -> List[float]:
+    """
+    Calculate album match percentage for all results at once
+
+    ### Arguments
+    - song: song to match
+    - results: results to match
+
+    ### Returns
+    - list of album match percentages in the same order as `results`
+    """
+
+    album_matches = batch_ratio(
+        slugify(song.album_name),
+        [slugify(result.album) if result.album else "" for result in results],
+    )
+
+    # Results without an album don't match at all
+    return [
+        album_match if result.album else 0.0
+        for result, album_match in zip(results, album_matches)
+    ]
+
+
 def order_results(
     results: List[Result],
     song: Song,
     search_query: Optional[str] = None,
+    slug_song_title: Optional[str] = None,
 ) -> Dict[Result, float]:
     """
     Order results.
@@ -637,6 +789,7 @@ def order_results(
     - results: The results to order.
     - song: The song to order for.
     - search_query: The search query.
+    - slug_song_title: The precreated `create_slug_song_title` value.
 
     ### Returns
     - The ordered results.
@@ -645,70 +798,123 @@ def order_results(
     # Assign an overall avg match value to each result
     links_with_match_value = {}
 
+    # Values that only depend on the song are created once
+    # instead of for every result
+    if slug_song_title is None:
+        slug_song_title = create_slug_song_title(song, search_query)
+
+    match_logging = logger.isEnabledFor(MATCH)
+
+    # Most songs have a single artist, in which case
+    # the other artists checks can't change the score
+    multiple_artists = len(song.artists) > 1
+
+    # Results without common words are skipped right away,
+    # so name strings are only created for the other ones
+    common_word_matches = [check_common_word(song, result) for result in results]
+    name_strings = {
+        index: create_name_strings(song, result)
+        for index, result in enumerate(results)
+        if common_word_matches[index]
+    }
+
+    # Score result names and albums against the song in batches
+    name_matches = dict(
+        zip(name_strings, calc_name_matches(list(name_strings.values())))
+    )
+    album_matches = calc_album_matches(song, results)
+
+    # Bind values used for every result and log message to locals
+    song_id = song.song_id
+
     # Iterate over all results
-    for result in results:
-        debug(
-            song.song_id,
-            result.result_id,
-            f"Calculating match value for {result.url} - {result.json}",
-        )
+    for index, result in enumerate(results):
+        result_id = result.result_id
 
-        # skip results that have no common words in their name
-        if not check_common_word(song, result):
+        # Dumping the result is slow, so only do it when it's going to be logged
+        if match_logging:
             debug(
-                song.song_id, result.result_id, "Skipping result due to no common words"
+                song_id,
+                result_id,
+                f"Calculating match value for {result.url} - {result.json}",
             )
 
+        # skip results that have no common words in their name
+        if not common_word_matches[index]:
+            debug(song_id, result_id, "Skipping result due to no common words")
+
             continue
 
+        # Create match strings once, they are used
+        # by both the artists fixup and the name match
+        match_strings = create_match_strings(
+            song, result, search_query, slug_song_title
+        )
+
         # Calculate match value for main artist
         artists_match = calc_main_artist_match(song, result)
-        debug(song.song_id, result.result_id, f"Main artist match: {artists_match}")
+        debug(song_id, result_id, f"Main artist match: {artists_match}")
 
-        # Calculate match value for all artists
-        other_artists_match = calc_artists_match(song, result)
-        debug(
-            song.song_id,
-            result.result_id,
-            f"Other artists match: {other_artists_match}",
-        )
+        if multiple_artists:
+            # Calculate match value for all artists
+            other_artists_match = calc_artists_match(song, result)
+            debug(
+                song_id,
+                result_id,
+                f"Other artists match: {other_artists_match}",
+            )
 
-        artists_match += other_artists_match
+            artists_match += other_artists_match
 
-        # Calculate initial artist match value
-        debug(song.song_id, result.result_id, f"Initial artists match: {artists_match}")
-        artists_match = artists_match / (2 if len(song.artists) > 1 else 1)
-        debug(song.song_id, result.result_id, f"First artists match: {artists_match}")
+            # Calculate initial artist match value
+            debug(
+                song_id,
+                result_id,
+                f"Initial artists match: {artists_match}",
+            )
+            artists_match = artists_match / 2
+            debug(song_id, result_id, f"First artists match: {artists_match}")
 
         # # First attempt to fix artist match
         artists_match = artists_match_fixup1(song, result, artists_match)
         debug(
-            song.song_id,
-            result.result_id,
+            song_id,
+            result_id,
             f"Artists match after fixup1: {artists_match}",
         )
 
         # Second attempt to fix artist match
-        artists_match = artists_match_fixup2(song, result, artists_match)
+        artists_match = artists_match_fixup2(
+            song, result, artists_match, match_strings=match_strings
+        )
         debug(
-            song.song_id,
-            result.result_id,
+            song_id,
+            result_id,
             f"Artists match after fixup2: {artists_match}",
         )
 
-        # Third attempt to fix artist match
-        artists_match = artists_match_fixup3(song, result, artists_match)
-        debug(
-            song.song_id,
-            result.result_id,
-            f"Artists match after fixup3: {artists_match}",
-        )
+        if multiple_artists:
+            # Third attempt to fix artist match
+            artists_match = artists_match_fixup3(song, result, artists_match)
+            debug(
+                song_id,
+                result_id,
+                f"Artists match after fixup3: {artists_match}",
+            )
 
-        debug(song.song_id, result.result_id, f"Final artists match: {artists_match}")
+        debug(song_id, result_id, f"Final artists match: {artists_match}")
 
         # Calculate name match
-        name_match = calc_name_match(song, result, search_query)
-        debug(song.song_id, result.result_id, f"Initial name match: {name_match}")
+        result_name, song_name = name_strings[index]
+        debug(song_id, result_id, f"SLUG MATCH STRINGS: {song_name} - {result_name}")
+        name_match = calc_name_match(
+            song,
+            result,
+            search_query,
+            name_matches[index],
+            match_strings,
+        )
+        debug(song_id, result_id, f"Initial name match: {name_match}")
 
         # Check if result contains forbidden words
         contains_fwords, found_fwords = check_forbidden_words(song, result)
@@ -717,25 +923,21 @@ def order_results(
                 name_match -= 15
 
         debug(
-            song.song_id,
-            result.result_id,
+            song_id,
+            result_id,
             f"Contains forbidden words: {contains_fwords}, {found_fwords}",
         )
-        debug(song.song_id, result.result_id, f"Final name match: {name_match}")
+        debug(song_id, result_id, f"Final name match: {name_match}")
 
         # Calculate album match
-        album_match = calc_album_match(song, result)
-        debug(song.song_id, result.result_id, f"Final album match: {album_match}")
-
-        # Calculate time match
-        time_match = calc_time_match(song, result)
-        debug(song.song_id, result.result_id, f"Final time match: {time_match}")
+        album_match = album_matches[index]
+        debug(song_id, result_id, f"Final album match: {album_match}")
 
         # Ignore results with name match lower than 60%
         if name_match <= 60:
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 "Skipping result due to name match lower than 60%",
             )
             continue
@@ -743,15 +945,20 @@ def order_results(
         # Ignore results with artists match lower than 70%
         if artists_match < 70 and result.source != "slider.kz":
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 "Skipping result due to artists match lower than 70%",
             )
             continue
 
+        # Calculate time match, only for results that passed
+        # the name and artists checks above
+        time_match = calc_time_match(song, result)
+        debug(song_id, result_id, f"Final time match: {time_match}")
+
         # Calculate total match
         average_match = (artists_match + name_match) / 2
-        debug(song.song_id, result.result_id, f"Average match: {average_match}")
+        debug(song_id, result_id, f"Average match: {average_match}")
 
         if (
             result.verified
@@ -763,16 +970,16 @@ def order_results(
             # so we add the album match to the average match
             average_match = (average_match + album_match) / 2
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 f"Average match /w album match: {average_match}",
             )
 
         # Skip results with time match lower than 25%
         if time_match < 25:
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 "Skipping result due to time match lower than 25%",
             )
             continue
@@ -782,8 +989,8 @@ def order_results(
         # we skip the result
         if time_match < 50 and average_match < 75:
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 "Skipping result due to time match < 50% and average match < 75%",
             )
             continue
@@ -799,8 +1006,8 @@ def order_results(
             average_match = (average_match + time_match) / 2
 
             debug(
-                song.song_id,
-                result.result_id,
+                song_id,
+                result_id,
                 f"Average match /w time match: {average_match}",
             )
 
@@ -808,15 +1015,15 @@ def order_results(
                 result.explicit != song.explicit
             ):
                 debug(
-                    song.song_id,
-                    result.result_id,
+                    song_id,
+                    result_id,
                     "Lowering average match due to explicit mismatch",
                 )
 
                 average_match -= 5
 
         average_match = min(average_match, 100)
-        debug(song.song_id, result.result_id, f"Final average match: {average_match}")
+        debug(song_id, result_id, f"Final average match: {average_match}")
 
         # the results along with the avg Match
         links_with_match_value[result] = average_match
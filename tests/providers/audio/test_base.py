@@ -0,0 +1,273 @@
+import threading
+import time
+
+from spotdl.providers.audio import base
+from spotdl.providers.audio.base import AudioProvider
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+
+
+class FakeYoutubeDL:
+    """Records created handlers instead of setting up yt-dlp"""
+
+    created = []
+
+    def __init__(self, *args, **kwargs):
+        FakeYoutubeDL.created.append(self)
+
+
+class SlowYoutubeDL(FakeYoutubeDL):
+    """Takes a while to set up, like the real handler"""
+
+    def __init__(self, *args, **kwargs):
+        time.sleep(0.05)
+        super().__init__(*args, **kwargs)
+
+
+class FakeProvider(AudioProvider):
+    """Returns the given results instead of searching"""
+
+    SUPPORTS_ISRC = True
+    GET_RESULTS_OPTS = [{"filter": "songs"}, {"filter": "videos"}]
+
+    def __init__(self, results=None, **kwargs):
+        super().__init__(**kwargs)
+
+        self.results = results or {}
+        self.searches = []
+
+    def get_results(self, search_term, **kwargs):
+        self.searches.append((search_term, kwargs))
+
+        return self.results.get(kwargs["filter"], [])
+
+
+def create_song(isrc=None):
+    """
+    Create a song with the given isrc
+    """
+
+    return Song.from_dict(
+        {
+            "name": "Ropes",
+            "artists": ["Dirty Palm", "Chandler Jewels"],
+            "artist": "Dirty Palm",
+            "genres": [],
+            "disc_number": 1,
+            "disc_count": 1,
+            "album_name": "Ropes",
+            "album_artist": "Dirty Palm",
+            "album_type": "single",
+            "duration": 188.0,
+            "year": 2021,
+            "date": "2021-10-28",
+            "track_number": 1,
+            "tracks_count": 1,
+            "song_id": "1t2qKa8K72IBC8yQlhD9bU",
+            "explicit": False,
+            "publisher": "",
+            "url": "https://open.spotify.com/track/1t2qKa8K72IBC8yQlhD9bU",
+            "isrc": isrc,
+            "cover_url": None,
+            "copyright_text": None,
+        }
+    )
+
+
+def create_result(name, views=None):
+    """
+    Create a result with the given name and views
+    """
+
+    return Result(
+        source="youtube",
+        url=f"https://www.youtube.com/watch?v={name}",
+        verified=False,
+        name=name,
+        duration=180.0,
+        author="artist",
+        result_id=name,
+        views=views,
+    )
+
+
+def test_audio_handler_created_once(monkeypatch):
+    """
+    Test that the audio handler is created on first use,
+    only once even if multiple threads need it at the same time
+    """
+
+    monkeypatch.setattr(base, "YoutubeDL", SlowYoutubeDL)
+    FakeYoutubeDL.created = []
+
+    provider = AudioProvider()
+    assert FakeYoutubeDL.created == []
+
+    barrier = threading.Barrier(8)
+    handlers = []
+
+    def get_handler():
+        barrier.wait()
+        handlers.append(provider.audio_handler)
+
+    threads = [threading.Thread(target=get_handler) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeYoutubeDL.created) == 1
+    assert all(handler is FakeYoutubeDL.created[0] for handler in handlers)
+    assert len(handlers) == 8
+
+
+def test_get_best_result_fetches_missing_views(monkeypatch):
+    """
+    Test that missing views are fetched in parallel,
+    with worker handlers that are never shared at the same time
+    and are reused by later calls
+    """
+
+    monkeypatch.setattr(base, "YoutubeDL", FakeYoutubeDL)
+    FakeYoutubeDL.created = []
+
+    views = {"best": 100, "popular": 1000, "unknown": 10}
+    results = {
+        create_result("best"): 90.0,
+        create_result("popular"): 88.0,
+        create_result("unknown"): 85.0,
+    }
+
+    calls = []
+    handlers_in_use = set()
+    lock = threading.Lock()
+
+    def get_views(url, audio_handler=None):
+        with lock:
+            assert audio_handler is not None
+            assert audio_handler not in handlers_in_use
+
+            calls.append(url)
+            handlers_in_use.add(audio_handler)
+
+        time.sleep(0.01)
+
+        with lock:
+            handlers_in_use.remove(audio_handler)
+
+        return views[url.split("?v=")[1]]
+
+    provider = AudioProvider()
+    monkeypatch.setattr(provider, "get_views", get_views)
+
+    best_result, best_score = provider.get_best_result(results)
+
+    assert best_result.name == "popular"
+    assert best_score == 100
+    assert sorted(calls) == sorted(result.url for result in results)
+
+    # Workers don't use the provider's handler
+    assert provider._audio_handler is None
+
+    # Handlers are reused instead of created again
+    created = list(FakeYoutubeDL.created)
+    assert 0 < len(created) <= len(results)
+    assert provider.get_best_result(results) == (best_result, best_score)
+    assert FakeYoutubeDL.created == created
+
+
+def test_get_best_result_same_views(monkeypatch):
+    """
+    Test that the best scored result is returned
+    if all of the results have the same views
+    """
+
+    results = {
+        create_result("best"): 90.0,
+        create_result("second"): 88.0,
+        create_result("third"): 85.0,
+    }
+
+    provider = AudioProvider()
+    monkeypatch.setattr(provider, "get_views", lambda url, audio_handler=None: 500)
+    monkeypatch.setattr(base, "YoutubeDL", FakeYoutubeDL)
+
+    assert provider.get_best_result(results) == (create_result("best"), 90.0)
+
+
+def test_get_best_result_single_missing_view(monkeypatch):
+    """
+    Test that a single missing view is fetched without worker threads
+    """
+
+    results = {
+        create_result("best", 10): 90.0,
+        create_result("popular"): 88.0,
+    }
+
+    threads = []
+
+    def get_views(url, audio_handler=None):
+        threads.append((threading.get_ident(), audio_handler))
+
+        return 1000
+
+    provider = AudioProvider()
+    monkeypatch.setattr(provider, "get_views", get_views)
+
+    assert provider.get_best_result(results) == (create_result("popular"), 100)
+    assert threads == [(threading.get_ident(), None)]
+
+
+def test_search_isrc_normalized():
+    """
+    Test that lowercase isrcs and isrcs with whitespace
+    are searched in their normalized form, but malformed ones are skipped
+    """
+
+    for isrc in ["GB2LD2110301", "gb2ld2110301", " GB2LD2110301\n"]:
+        provider = FakeProvider()
+        provider.search(create_song(isrc))
+
+        assert provider.searches[0] == ("GB2LD2110301", {"filter": "songs"})
+
+    provider = FakeProvider()
+    provider.search(create_song("not an isrc"))
+
+    assert "not an isrc" not in [term for term, _ in provider.searches]
+
+
+def test_search_unfiltered_empty_first_search():
+    """
+    Test that unfiltered search returns the top result
+    of the next search if the first one found nothing
+    """
+
+    provider = FakeProvider(
+        {"videos": [create_result("video"), create_result("other")]},
+        filter_results=False,
+    )
+
+    assert provider.search(create_song()) == create_result("video").url
+    assert [options for _, options in provider.searches] == provider.GET_RESULTS_OPTS
+
+
+def test_search_unfiltered_unverified_result():
+    """
+    Test that unfiltered search returns the top result
+    of the first search even if it's not verified
+    """
+
+    provider = FakeProvider(
+        {"songs": [create_result("song")], "videos": [create_result("video")]},
+        filter_results=False,
+    )
+
+    assert provider.search(create_song()) == create_result("song").url
+    assert [options for _, options in provider.searches] == [{"filter": "songs"}]
+
+    # Nothing found at all
+    provider = FakeProvider(filter_results=False)
+
+    assert provider.search(create_song()) is None
@@ -2,9 +2,11 @@ from pathlib import Path
 
 from spotdl.types.song import Song, SongList
 from spotdl.utils.formatter import (
+    batch_ratio,
     create_file_name,
     create_song_title,
     parse_duration,
+    ratio,
     sanitize_string,
 )
 
@@ -166,3 +168,14 @@ def test_parse_duration():
     assert parse_duration("views") == float(0.0)
     assert parse_duration([1, 2, 3]) == float(0.0)  # type: ignore
     assert parse_duration({"json": "data"}) == float(0.0)  # type: ignore
+
+
+def test_batch_ratio():
+    """
+    Test batch ratio function
+    """
+
+    strings = ["test", "tset", "", "completely different"]
+
+    assert batch_ratio("test", strings) == [ratio("test", s) for s in strings]
+    assert batch_ratio("test", []) == []
@@ -0,0 +1,141 @@
+from spotdl.types.result import Result
+from spotdl.types.song import Song
+from spotdl.utils.formatter import ratio
+from spotdl.utils.matching import (
+    calc_album_matches,
+    calc_name_matches,
+    create_name_strings,
+    create_simple_slug,
+    create_slug_song_title,
+    fill_strings,
+)
+
+SONG = Song.from_dict(
+    {
+        "name": "Down",
+        "artists": ["Jay Sean", "Lil Wayne"],
+        "artist": "Jay Sean",
+        "genres": [],
+        "disc_number": 1,
+        "disc_count": 1,
+        "album_name": "All or Nothing",
+        "album_artist": "Jay Sean",
+        "album_type": "album",
+        "duration": 212.0,
+        "year": 2009,
+        "date": "2009-01-01",
+        "track_number": 1,
+        "tracks_count": 1,
+        "song_id": "6cmm1LMvZdB5zsCwX5BjqE",
+        "explicit": False,
+        "publisher": "",
+        "url": "https://open.spotify.com/track/6cmm1LMvZdB5zsCwX5BjqE",
+        "isrc": "USCM50900016",
+        "cover_url": None,
+        "copyright_text": None,
+    }
+)
+
+
+def create_result(name, album=None):
+    """
+    Create a result with the given name and album
+    """
+
+    return Result(
+        source="youtube-music",
+        url=f"https://music.youtube.com/watch?v={name}",
+        verified=True,
+        name=name,
+        duration=212.0,
+        author="Jay Sean",
+        result_id=name,
+        artists=("Jay Sean", "Lil Wayne"),
+        album=album,
+    )
+
+
+def test_create_simple_slug():
+    """
+    Test create simple slug function
+    """
+
+    assert create_simple_slug("Piszę to na matmie") == "piszetonamatmie"
+    assert create_simple_slug("AC/DC") == "acdc"
+    assert create_simple_slug("") == ""
+
+
+def test_fill_strings():
+    """
+    Test fill strings function
+    """
+
+    assert fill_strings(["Jay Sean", "Lil Wayne"], "down", "jay-sean-down") == (
+        "down-jaysean",
+        "jay-sean-down",
+    )
+
+    # Strings added to the first string are also added to the second one
+    assert fill_strings(["Mata", "Fundacja"], "mata-song", "fundacja-song") == (
+        "mata-song-fundacja",
+        "fundacja-song-mata",
+    )
+
+    assert fill_strings([], "down", "up") == ("down", "up")
+
+
+def test_create_slug_song_title():
+    """
+    Test create slug song title function
+    """
+
+    assert create_slug_song_title(SONG) == "jay-sean-lil-wayne-down"
+    assert create_slug_song_title(SONG, "{title} {album}") == "down-all-or-nothing"
+
+
+def test_create_name_strings():
+    """
+    Test create name strings function
+    """
+
+    assert create_name_strings(SONG, create_result("Down (feat. Lil Wayne)")) == (
+        "down-feat-lil-wayne",
+        "down",
+    )
+    assert create_name_strings(SONG, create_result("DOWN")) == ("down", "down")
+
+
+def test_calc_name_matches():
+    """
+    Test calc name matches function
+    """
+
+    name_strings = [
+        create_name_strings(SONG, create_result(name))
+        for name in ["Down", "Down (feat. Lil Wayne)", "Up"]
+    ]
+
+    assert calc_name_matches(name_strings) == [
+        ratio(result_name, song_name) for result_name, song_name in name_strings
+    ]
+    assert calc_name_matches(name_strings)[0] == 100.0
+    assert calc_name_matches([]) == []
+
+
+def test_calc_album_matches():
+    """
+    Test calc album matches function
+    """
+
+    results = [
+        create_result("Down", "All or Nothing"),
+        create_result("Down", "All or Nothing (Deluxe)"),
+        create_result("Down"),
+    ]
+
+    assert calc_album_matches(SONG, results) == [
+        100.0,
+        ratio("all-or-nothing", "all-or-nothing-deluxe"),
+        0.0,
+    ]
+    assert calc_album_matches(SONG, []) == []